@@ -3,14 +3,35 @@ import json
 import requests
 import csv
 import os
+import re
 import logging
 import time
 import argparse
 import getpass
-from typing import List, Dict, Optional, Tuple
+import tempfile
+import threading
+from functools import cached_property
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import List, Dict, Optional, Set, Tuple
 from tenacity import retry, stop_after_attempt, wait_exponential
 from datetime import datetime, timedelta, timezone
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib encoder
+    orjson = None
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+def dumps_json(payload) -> bytes:
+    """Serialize a request body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
 def get_required_input(prompt, is_password=False):
     """Get required input from user with clear prompting."""
     while True:
@@ -30,6 +51,8 @@ def parse_arguments():
     parser.add_argument('--spreadsheet-url', help='Google Spreadsheet URL')
     parser.add_argument('--username', help='API username')
     parser.add_argument('--password', help='API password')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Ignore the cached auth token and spreadsheet data')
     
     args = parser.parse_args()
     
@@ -70,20 +93,92 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Data rows start after the 2 header rows and span columns A-T
+SPREADSHEET_RANGE = "A3:T"
+SPREADSHEET_COLUMNS = 20
+
+_SHEET_ID_RE = re.compile(r'/d/([a-zA-Z0-9-_]+)')
+
+# Day-to-column mapping for opening hours:
+# 0 = CalendarName
+# 1 = Empty
+# 2-4 = Monday (day 1)
+# 5-7 = Tuesday (day 2)
+# 8-10 = Wednesday (day 3)
+# 11-13 = Thursday (day 4)
+# 14-16 = Friday (day 5)
+# 17-19 = Saturday (day 6)
+_DAYS_MAPPING = ((1, 2), (2, 5), (3, 8), (4, 11), (5, 14), (6, 17))
+
+# Cell values normalized to "Chiuso"
+_CLOSED_VALUES = frozenset({"chiuso", "closed", ""})
+
+# Same inputs as strptime('%H:%M'), which also accepts single-digit hours and minutes
+_TIME_RE = re.compile(r'(?:[01]?\d|2[0-3]):[0-5]?\d')
+
+# Concurrency limits for API calls
+MAX_WORKERS = 8
+MAX_OPENING_HOURS_WORKERS = 4
+MAX_CONCURRENT_REQUESTS = 8
+HTTP_POOL_SIZE = 16
+
+# Client-side rate limit and retry policy for API calls
+MAX_REQUESTS_PER_SECOND = 10
+MAX_RETRIES = 3
+# Server errors are only retried for GET, a POST may already have been processed
+GET_RETRY_STATUSES = frozenset({500, 502, 503, 504})
+# The adapter only retries failed connections, never a request that was already sent.
+# Status codes, including Retry-After, are left to CalendarManager.request()
+HTTP_RETRY = Retry(
+    total=MAX_RETRIES,
+    read=0,
+    status=0,
+    backoff_factor=1,
+    respect_retry_after_header=False,
+    raise_on_status=False
+)
+
+# On-disk auth token cache, tokens are reused for just under an hour
+CACHE_DIR = os.path.expanduser("~/.cache/createCalendars")
+TOKEN_CACHE_FILE = os.path.join(CACHE_DIR, "tokens.json")
+TOKEN_TTL_SECONDS = 3500
+
+# Drive API endpoint used to check whether cached spreadsheet values are stale
+DRIVE_FILES_URL = "https://www.googleapis.com/drive/v3/files"
+
 class CalendarManager:
-    def __init__(self, api_url, spreadsheet_url, username, password):
+    def __init__(self, api_url, spreadsheet_url, username, password, use_cache=True):
         """Initialize with required configuration parameters."""
         try:
-            self.gc = gspread.service_account()
+            self.use_cache = use_cache
             self.BASE_API_URL = api_url
             self.SPREADSHEET_URL = spreadsheet_url
+            match = _SHEET_ID_RE.search(spreadsheet_url)
+            if not match:
+                raise ValueError(f"Invalid Google Spreadsheet URL: {spreadsheet_url}")
+            self.spreadsheet_id = match.group(1)
             self.API_CREDENTIALS = {
                 "username": username,
                 "password": password
             }
-            self.token = self.get_token()
-            self.headers = {"Authorization": f"Bearer {self.token}"}
+            # Pooled session so connections are kept alive across calls and threads
+            self.session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=HTTP_POOL_SIZE,
+                pool_maxsize=HTTP_POOL_SIZE,
+                max_retries=HTTP_RETRY
+            )
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+            self.request_slots = threading.Semaphore(MAX_CONCURRENT_REQUESTS)
+            self.rate_lock = threading.Lock()
+            self.request_times = deque()
+            self.csv_lock = threading.Lock()
+            self.csv_writer = None
+            self.token_lock = threading.Lock()
+            self.admin_id = None
             self.calendar_groups = []
+            self.calendar_time_slots = []
             
             # Set date range
             self.start_date = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
@@ -92,84 +187,254 @@ class CalendarManager:
             logger.error(f"Initialization failed: {e}")
             raise
 
-    def get_token(self):
-        """Get authentication token from API."""
+    # Credentials are resolved on first use, so creating a manager does no I/O
+    @cached_property
+    def gc(self) -> gspread.Client:
+        """Google Sheets client authorized with the service account."""
+        return gspread.service_account()
+
+    @cached_property
+    def token(self) -> str:
+        """API authentication token."""
+        return self.get_token(use_cache=self.use_cache)
+
+    @cached_property
+    def headers(self) -> Dict[str, str]:
+        """Authorization headers for API calls."""
+        return {"Authorization": f"Bearer {self.token}"}
+
+    @cached_property
+    def json_headers(self) -> Dict[str, str]:
+        """Authorization headers for API calls with a JSON body."""
+        return {**self.headers, **JSON_HEADERS}
+
+    def throttle(self) -> None:
+        """Block until a request fits in the sliding one-second rate window."""
+        with self.rate_lock:
+            now = time.monotonic()
+            while self.request_times and now - self.request_times[0] >= 1:
+                self.request_times.popleft()
+            if len(self.request_times) >= MAX_REQUESTS_PER_SECOND:
+                time.sleep(1 - (now - self.request_times[0]))
+                self.request_times.popleft()
+                now = time.monotonic()
+            self.request_times.append(now)
+
+    def send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a single rate-limited request through the shared session."""
+        self.throttle()
+        with self.request_slots:
+            return self.session.request(method, url, **kwargs)
+
+    def get_retry_delay(self, method: str, response: requests.Response, attempt: int) -> Optional[float]:
+        """Get the wait time before retrying a response, or None if it must not be retried.
+
+        429, and 503 with Retry-After, mean the request was rejected and are retried
+        for any method. Other server errors are only retried for GET.
+        """
+        status = response.status_code
+        retry_after = response.headers.get("Retry-After", "")
+        if not (status == 429 or (status == 503 and retry_after)
+                or (method == "GET" and status in GET_RETRY_STATUSES)):
+            return None
+        if retry_after.isdecimal():
+            return float(retry_after)
+        return float(2 ** attempt)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request, retrying rejected calls and refreshing the token once if needed."""
+        token_refreshed = False
+        for attempt in range(MAX_RETRIES + 1):
+            response = self.send(method, url, **kwargs)
+            headers = kwargs.get("headers") or {}
+            if response.status_code == 401 and "Authorization" in headers and not token_refreshed:
+                # A cached token may have been revoked, fetch a fresh one and retry once
+                self.refresh_token(headers["Authorization"])
+                kwargs["headers"] = {**headers, "Authorization": self.headers["Authorization"]}
+                token_refreshed = True
+                response = self.send(method, url, **kwargs)
+            delay = self.get_retry_delay(method, response, attempt)
+            if delay is None or attempt == MAX_RETRIES:
+                return response
+            # Sleep outside request_slots, the next attempt goes through throttle() again
+            logger.warning(f"{method} {url} returned {response.status_code}, retrying in {delay:.0f}s")
+            time.sleep(delay)
+        return response
+
+    def load_token_cache(self) -> Dict[str, Dict]:
+        """Load cached tokens from disk, ignoring a missing or corrupt cache file."""
+        try:
+            with open(TOKEN_CACHE_FILE) as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def write_cache_file(self, path: str, payload) -> None:
+        """Atomically write a JSON cache file readable by the current user only."""
+        os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+        os.chmod(CACHE_DIR, 0o700)
+        # mkstemp creates the file with 0600, os.replace never exposes a partial write
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        try:
+            with open(fd, mode='w') as file:
+                json.dump(payload, file)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def save_token_cache(self, cache: Dict[str, Dict]) -> None:
+        """Persist cached tokens to disk, readable by the current user only."""
+        try:
+            self.write_cache_file(TOKEN_CACHE_FILE, cache)
+        except OSError as e:
+            logger.warning(f"Could not write token cache: {e}")
+
+    def get_token(self, use_cache: bool = True):
+        """Get authentication token, reusing a cached one while it is still valid."""
+        cache_key = f"{self.BASE_API_URL}|{self.API_CREDENTIALS['username']}"
+        cache = self.load_token_cache()
+        entry = cache.get(cache_key)
+        if use_cache and entry and entry.get("expires_at", 0) > time.time():
+            logger.info("Using cached authentication token")
+            return entry["token"]
+
         endpoint_auth = f"{self.BASE_API_URL}/auth"
         try:
-            response = requests.post(
+            response = self.request(
+                "POST",
                 endpoint_auth,
-                json=self.API_CREDENTIALS,
+                data=dumps_json(self.API_CREDENTIALS),
+                headers=JSON_HEADERS,
                 timeout=10
             )
             response.raise_for_status()
-            return response.json()["token"]
+            token = response.json()["token"]
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to get token: {e}")
             raise
 
+        cache[cache_key] = {"token": token, "expires_at": time.time() + TOKEN_TTL_SECONDS}
+        self.save_token_cache(cache)
+        return token
+
+    def refresh_token(self, stale_authorization: str) -> None:
+        """Replace a rejected token, unless another thread already did."""
+        with self.token_lock:
+            if self.headers["Authorization"] == stale_authorization:
+                self.token = self.get_token(use_cache=False)
+                self.headers = {"Authorization": f"Bearer {self.token}"}
+                self.json_headers = {**self.headers, **JSON_HEADERS}
+
     def is_valid_time(self, time_str: str) -> bool:
         """Check if a string is a valid time in HH:MM format or 'Chiuso'."""
-        if time_str.lower() == "chiuso":
-            return True
-        try:
-            datetime.strptime(time_str, '%H:%M')
-            return True
-        except ValueError:
-            return False
+        return time_str.lower() == "chiuso" or bool(_TIME_RE.fullmatch(time_str))
 
     def clean_spreadsheet_data(self, data: List[List[str]]) -> List[List[str]]:
         """Clean and normalize spreadsheet data."""
-        cleaned = []
-        for row in data:
-            cleaned_row = []
-            for cell in row:
-                # Normalize "Chiuso" variations and empty strings
-                cell_str = str(cell).strip()
-                if cell_str.lower() in ["chiuso", "closed", ""]:
-                    cleaned_row.append("Chiuso")
-                else:
-                    cleaned_row.append(cell_str)
-            cleaned.append(cleaned_row)
-        return cleaned
+        # Normalize "Chiuso" variations and empty strings
+        return [
+            [
+                "Chiuso" if cell_str.lower() in _CLOSED_VALUES else cell_str
+                for cell_str in map(str.strip, row)
+            ]
+            for row in data
+        ]
 
     def group_calendar_data(self, data: List[List[str]]) -> None:
         """Group calendar data based on empty cells below calendar names."""
         current_group = []
         current_name = ""
+        append_group = self.calendar_groups.append
         
-        for i, row in enumerate(data):
-            if not row[0].strip() or row[0].strip() == "Chiuso":  # Empty calendar name or "Chiuso" means continuation
+        # Cells are already stripped by clean_spreadsheet_data, empty ones become "Chiuso"
+        for row in data:
+            name = row[0]
+            if not name or name == "Chiuso":  # Empty calendar name or "Chiuso" means continuation
                 if current_name:  # Only add if we have a calendar name
                     current_group.append(row)
             else:
                 # Save previous group if exists
                 if current_name:
-                    self.calendar_groups.append((current_name, current_group))
+                    append_group((current_name, current_group))
                 
                 # Start new group
-                current_name = row[0]
+                current_name = name
                 current_group = [row]
         
         # Add the last group
         if current_name:
-            self.calendar_groups.append((current_name, current_group))
+            append_group((current_name, current_group))
 
+    def get_spreadsheet_modified_time(self, spreadsheet_id: str) -> str:
+        """Get the last modification time of a spreadsheet from the Drive API."""
+        response = self.gc.http_client.request(
+            "get",
+            f"{DRIVE_FILES_URL}/{spreadsheet_id}",
+            params={"fields": "modifiedTime", "supportsAllDrives": True}
+        )
+        return response.json()["modifiedTime"]
+
+    # gspread uses its own HTTP client, so Sheets calls keep the tenacity retry
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=10)
     )
-    def read_spreadsheet(self, url: str) -> bool:
+    def fetch_spreadsheet_values(self, spreadsheet_id: str) -> List[List[str]]:
+        """Fetch spreadsheet values, reusing the on-disk copy if the sheet is unchanged."""
+        cache_file = os.path.join(CACHE_DIR, f"spreadsheet_{spreadsheet_id}.json")
+        modified_time = None
+
+        if self.use_cache:
+            # The cache needs the Drive API, without it the sheet is read uncached
+            try:
+                modified_time = self.get_spreadsheet_modified_time(spreadsheet_id)
+            except Exception as e:
+                logger.warning(f"Could not check spreadsheet modification time, not using cache: {e}")
+
+        if modified_time is not None:
+            try:
+                with open(cache_file) as file:
+                    cached = json.load(file)
+                if cached.get("modified_time") == modified_time:
+                    logger.info("Using cached spreadsheet data")
+                    return cached["values"]
+            except (OSError, ValueError, KeyError):
+                pass
+
+        # Fetch values in a single call, skipping the 2 header rows via the range
+        response = self.gc.http_client.values_batch_get(
+            spreadsheet_id,
+            ranges=[SPREADSHEET_RANGE]
+        )
+        values = response["valueRanges"][0].get("values", [])
+        if modified_time is None:
+            return values
+
+        try:
+            self.write_cache_file(cache_file, {"modified_time": modified_time, "values": values})
+        except OSError as e:
+            logger.warning(f"Could not write spreadsheet cache: {e}")
+        return values
+
+    def read_spreadsheet(self) -> bool:
         """Read data from Google Spreadsheet and group calendar data."""
+        # Load credentials outside the retried fetch so a bad service account key fails fast
+        try:
+            self.gc
+        except Exception as e:
+            logger.error(f"Failed to load Google service account credentials: {e}")
+            raise
+
         try:
-            sh = self.gc.open_by_url(url)
-            data = sh.sheet1.get_all_values()
+            data = self.fetch_spreadsheet_values(self.spreadsheet_id)
             
-            if not data or len(data) < 2:
+            if not data:
                 logger.warning("No data found in spreadsheet")
                 return False
 
-            # Remove header rows (first 2 rows)
-            data = data[2:]
+            # The Values API trims trailing empty cells, pad rows to the full width
+            data = [row + [""] * (SPREADSHEET_COLUMNS - len(row)) for row in data]
             cleaned_data = self.clean_spreadsheet_data(data)
             self.group_calendar_data(cleaned_data)
             return True
@@ -178,125 +443,137 @@ class CalendarManager:
             logger.error(f"Error reading spreadsheet: {e}")
             return False
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10)
-    )
     def get_admin_id(self) -> str:
-        """Get the ID of the admin user."""
+        """Get the ID of the admin user, fetching it only on first use."""
+        if self.admin_id is not None:
+            return self.admin_id
         try:
             ep_get_admin = f"{self.BASE_API_URL}/users?roles=admin"
-            response = requests.get(ep_get_admin, headers=self.headers, timeout=10)
+            response = self.request("GET", ep_get_admin, headers=self.headers, timeout=10)
             response.raise_for_status()
-            return response.json()[0]["id"]
+            self.admin_id = response.json()[0]["id"]
+            return self.admin_id
         except Exception as e:
             logger.error(f"Failed to get admin ID: {e}")
             raise
 
-    def process_opening_hours(self, group: List[List[str]]) -> Dict[Tuple[str, str, str, str], List[int]]:
-        """Process opening hours with correct day-to-column mapping."""
-        time_slots = {}
+    def process_opening_hours(
+        self,
+        group: List[List[str]],
+        errors: Optional[List[str]] = None
+    ) -> Dict[Tuple[str, str, str, str], Set[int]]:
+        """Process opening hours with correct day-to-column mapping.
+
+        Invalid time formats are appended to ``errors`` when a list is given.
+        """
+        time_slots = defaultdict(set)
+        # Local binds avoid repeated attribute lookups in the loop
+        is_valid = self.is_valid_time
+        warn = logger.warning
         
         for i, row in enumerate(group):
-            # Correct day mapping based on the clarified structure:
-            # Columns:
-            # 0 = CalendarName
-            # 1 = Empty
-            # 2-4 = Monday (day 1)
-            # 5-7 = Tuesday (day 2)
-            # 8-10 = Wednesday (day 3)
-            # 11-13 = Thursday (day 4)
-            # 14-16 = Friday (day 5)
-            # 17-19 = Saturday (day 6)
-            
-            days_mapping = [
-                (1, 2),   # Monday (day 1) - columns 2-4
-                (2, 5),    # Tuesday (day 2) - columns 5-7
-                (3, 8),    # Wednesday (day 3) - columns 8-10
-                (4, 11),   # Thursday (day 4) - columns 11-13
-                (5, 14),   # Friday (day 5) - columns 14-16
-                (6, 17)    # Saturday (day 6) - columns 17-19
-            ]
-            
-            for day_num, day_col in days_mapping:
+            for day_num, day_col in _DAYS_MAPPING:
                 # Check if we have enough columns (need 3: open, close, duration)
                 if day_col + 2 >= len(row):
-                    logger.warning(f"Incomplete data in row {i}, day {day_num} (columns {day_col}-{day_col+2})")
+                    warn(f"Incomplete data in row {i}, day {day_num} (columns {day_col}-{day_col+2})")
                     continue
                     
-                begin_hour = str(row[day_col]).strip()
-                end_hour = str(row[day_col + 1]).strip()
-                meeting_minutes = str(row[day_col + 2]).strip()
+                begin_hour = row[day_col].strip()
+                end_hour = row[day_col + 1].strip()
+                meeting_minutes = row[day_col + 2].strip()
                 
                 # Skip if closed or empty
                 if begin_hour == "Chiuso" or end_hour == "Chiuso" or not begin_hour or not end_hour:
                     continue
                     
                 # Validate time format
-                if not (self.is_valid_time(begin_hour) and self.is_valid_time(end_hour)):
-                    logger.warning(f"Invalid time format in row {i}, day {day_num}: {begin_hour}-{end_hour}")
+                if not (is_valid(begin_hour) and is_valid(end_hour)):
+                    message = f"Invalid time format in row {i}, day {day_num}: {begin_hour}-{end_hour}"
+                    warn(message)
+                    if errors is not None:
+                        errors.append(message)
                     continue
                 
                 # Default to 30 minutes if meeting duration is invalid
-                try:
-                    meeting_min = int(meeting_minutes) if meeting_minutes.isdigit() else 30
-                except ValueError:
+                # isdecimal matches what int() accepts, isdigit also allows e.g. "²"
+                if meeting_minutes.isdecimal():
+                    meeting_min = int(meeting_minutes)
+                else:
                     meeting_min = 30
-                    logger.warning(f"Invalid meeting minutes '{meeting_minutes}', using default 30")
+                    if meeting_minutes != "Chiuso":
+                        warn(f"Invalid meeting minutes '{meeting_minutes}', using default 30")
                 
                 # Create a unique key for this time slot
                 slot_key = (begin_hour, end_hour, str(meeting_min), "no")
                 
-                # Add the day to this time slot's days list
-                if slot_key not in time_slots:
-                    time_slots[slot_key] = []
-                if day_num not in time_slots[slot_key]:  # Prevent duplicate days
-                    time_slots[slot_key].append(day_num)
+                # Add the day to this time slot's days, the set drops duplicates
+                time_slots[slot_key].add(day_num)
                     
         return time_slots
 
-    def create_opening_hours(self, id_cal: str, time_slots: Dict[Tuple[str, str, str, str], List[int]]) -> bool:
+    def validate_all(self) -> List[str]:
+        """Process the opening hours of every calendar and collect blocking errors."""
+        errors = []
+        self.calendar_time_slots = []
+        for name, group in self.calendar_groups:
+            group_errors = []
+            self.calendar_time_slots.append(self.process_opening_hours(group, group_errors))
+            errors.extend(f"{name}: {error}" for error in group_errors)
+        return errors
+
+    def create_opening_hours(self, id_cal: str, time_slots: Dict[Tuple[str, str, str, str], Set[int]]) -> bool:
         """Create opening hours for a calendar with grouped days for identical time slots."""
         ep_openings = f"{self.BASE_API_URL}/calendars/{id_cal}/opening-hours"
-        success = True
-        
-        for (begin_hour, end_hour, meeting_min, is_moderated), days in time_slots.items():
+        payloads = [
+            {
+                "name": f"Orario {begin_hour}-{end_hour}",
+                "start_date": self.start_date,
+                "end_date": self.end_date,
+                "days_of_week": sorted(days),
+                "begin_hour": begin_hour,
+                "end_hour": end_hour,
+                "is_moderated": is_moderated.lower() == "si",
+                "meeting_minutes": int(meeting_min),
+                "interval_minutes": 0,
+                "meeting_queue": 1,
+            }
+            for (begin_hour, end_hour, meeting_min, is_moderated), days in time_slots.items()
+        ]
+        request = self.request
+
+        def post_opening_hours(opening_hours: Dict) -> bool:
             try:
-                opening_hours = {
-                    "name": f"Orario {begin_hour}-{end_hour}",
-                    "start_date": self.start_date,
-                    "end_date": self.end_date,
-                    "days_of_week": sorted(days),
-                    "begin_hour": begin_hour,
-                    "end_hour": end_hour,
-                    "is_moderated": is_moderated.lower() == "si",
-                    "meeting_minutes": int(meeting_min),
-                    "interval_minutes": 0,
-                    "meeting_queue": 1,
-                }
-
-                response = requests.post(
+                response = request(
+                    "POST",
                     ep_openings,
-                    json=opening_hours,
-                    headers=self.headers,
+                    data=dumps_json(opening_hours),
+                    headers=self.json_headers,
                     timeout=10
                 )
                 response.raise_for_status()
                 
-                logger.info(f"Created opening hours for calendar {id_cal}: Days {days} {begin_hour}-{end_hour}")
-                time.sleep(1)  # Rate limiting
+                logger.info(
+                    f"Created opening hours for calendar {id_cal}: Days {opening_hours['days_of_week']} "
+                    f"{opening_hours['begin_hour']}-{opening_hours['end_hour']}"
+                )
+                return True
                 
             except Exception as e:
                 logger.error(f"Failed to create opening hours for calendar {id_cal}: {e}")
-                success = False
+                return False
+
+        # Time slots are independent of each other, so post them concurrently
+        with ThreadPoolExecutor(max_workers=MAX_OPENING_HOURS_WORKERS) as executor:
+            results = list(executor.map(post_opening_hours, payloads))
                 
-        return success
+        return all(results)
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10)
-    )
-    def create_calendar(self, name: str, group: List[List[str]]) -> Optional[str]:
+    def create_calendar(
+        self,
+        name: str,
+        group: List[List[str]],
+        time_slots: Optional[Dict[Tuple[str, str, str, str], Set[int]]] = None
+    ) -> Optional[str]:
         """Create a calendar with its opening hours."""
         try:
             logger.info(f"Creating calendar: {name}")
@@ -323,10 +600,11 @@ class CalendarManager:
                 "reservation_limits": []
             }
 
-            response = requests.post(
+            response = self.request(
+                "POST",
                 f"{self.BASE_API_URL}/calendars",
-                json=calendar,
-                headers=self.headers,
+                data=dumps_json(calendar),
+                headers=self.json_headers,
                 timeout=10
             )
             response.raise_for_status()
@@ -335,18 +613,16 @@ class CalendarManager:
             logger.info(f"Created calendar {name} with ID: {id_calendar}")
 
             # Save calendar ID to CSV
-            with open('calendars_ids.csv', mode='a', newline='') as file:
-                writer = csv.writer(file)
-                writer.writerow([id_calendar, name])
+            with self.csv_lock:
+                self.csv_writer.writerow([id_calendar, name])
 
-            # Process and create opening hours
-            time_slots = self.process_opening_hours(group)
+            # Process and create opening hours, unless already done by validate_all
+            if time_slots is None:
+                time_slots = self.process_opening_hours(group)
             if not time_slots:
                 logger.warning(f"No valid opening hours found for calendar {name}")
-            else:
-                self.create_opening_hours(id_calendar, time_slots)
-            
-            time.sleep(2)  # Rate limiting between calendar creations
+            elif not self.create_opening_hours(id_calendar, time_slots):
+                logger.error(f"Calendar {name} ({id_calendar}) is missing some opening hours")
             
             return id_calendar
             
@@ -356,22 +632,41 @@ class CalendarManager:
 
     def run(self) -> None:
         """Main execution method."""
+        # Keep the CSV file open for the whole run instead of reopening it per calendar
+        csv_file = open('calendars_ids.csv', mode='w', newline='', buffering=8192)
         try:
-            # Initialize CSV file with headers
-            with open('calendars_ids.csv', mode='w', newline='') as file:
-                writer = csv.writer(file)
-                writer.writerow(["Calendar ID", "Calendar Name"])
+            self.csv_writer = csv.writer(csv_file)
+            self.csv_writer.writerow(["Calendar ID", "Calendar Name"])
 
-            if not self.read_spreadsheet(self.SPREADSHEET_URL):
+            if not self.read_spreadsheet():
                 logger.error("No data available to process")
                 return
 
-            for name, group in self.calendar_groups:
-                self.create_calendar(name, group)
+            # Validate the whole sheet before any calendar is created
+            errors = self.validate_all()
+            if errors:
+                logger.error(f"Spreadsheet validation failed with {len(errors)} error(s), no calendars created:")
+                for error in errors:
+                    logger.error(f"  {error}")
+                return
+
+            # Resolve the admin once before fanning out to the worker threads
+            self.get_admin_id()
+
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                futures = [
+                    executor.submit(self.create_calendar, name, group, time_slots)
+                    for (name, group), time_slots in zip(self.calendar_groups, self.calendar_time_slots)
+                ]
+                for future in futures:
+                    future.result()
                 
         except Exception as e:
             logger.error(f"Application failed: {e}")
             raise
+        finally:
+            csv_file.close()
+            self.csv_writer = None
 
 
 if __name__ == "__main__":
@@ -389,7 +684,8 @@ if __name__ == "__main__":
             api_url=args.api_url,
             spreadsheet_url=args.spreadsheet_url,
             username=args.username,
-            password=args.password
+            password=args.password,
+            use_cache=not args.no_cache
         )
         manager.run()
     except Exception as e: